@@ -6,13 +6,17 @@ Counts word occurrences by length ranges and displays results in tables and grap
 """
 
 import argparse
+import bisect
+import functools
+import io
+import mmap
 import os
 import re
 import sys
-import threading
-from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+from typing import Callable, List, NamedTuple, Tuple, Dict, Optional
 from collections import Counter
 
 
@@ -29,6 +33,17 @@ try:
 except ImportError:
     HAS_MATPLOTLIB = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if HAS_NUMPY:
+    # Byte -> "is an ASCII \w character" table
+    ASCII_WORD_BYTES = np.zeros(256, dtype=bool)
+    ASCII_WORD_BYTES[list(b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_')] = True
+
 try:
     import colorama
     colorama.init()
@@ -36,17 +51,27 @@ try:
 except ImportError:
     HAS_COLORAMA = False
 
-progress_lock = threading.Lock()
+PROGRESS_BLOCK_SIZE = 65536
+# Below this many bytes (roughly 200k words), spawning worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 2 << 20
+
+# In 'auto' mode, lengths up to this get a row each even when no word has that length
+AUTO_DENSE_MAX_LEN = 1000
+# Longest range bound for which WordCounter builds a dense length -> range table
+LOOKUP_TABLE_MAX_LEN = 100_000
 
+# Bytes per block scanned by count_ascii_word_lengths
+ASCII_BLOCK_SIZE = 1 << 22
 
-@dataclass(frozen=True)
-class LengthRange:
+WORD_RE = re.compile(r'\w+')
+WORD_BYTES_RE = re.compile(rb'\w+')
+NON_ASCII_BYTES_RE = re.compile(rb'[\x80-\xff]')
+
+
+class LengthRange(NamedTuple):
     min_len: int
     max_len: int
 
-    def contains(self, length: int) -> bool:
-        return self.min_len <= length <= self.max_len
-
     def __str__(self) -> str:
         return f"{self.min_len}-{self.max_len}"
 
@@ -57,18 +82,71 @@ class WordCounter:
         self.counts = {length_range: 0 for length_range in length_ranges}
         self.other_count = 0
         self.total_words = 0
+        # Length -> range lookup, built on first use so 'auto' mode never pays for it
+        self.range_lookup: Optional[List[Optional[LengthRange]]] = None
+        self.segment_starts: Optional[List[int]] = None
+        self.segment_ranges: Optional[List[Optional[LengthRange]]] = None
+
+    def build_lookup(self) -> None:
+        self.range_lookup = self.build_range_lookup(self.length_ranges)
+        if self.range_lookup is None:
+            self.segment_starts, self.segment_ranges = self.build_range_segments(self.length_ranges)
+
+    @staticmethod
+    def build_range_lookup(length_ranges: List[LengthRange]) -> Optional[List[Optional[LengthRange]]]:
+        # Table indexed by word length giving the matching range (None means "other")
+        max_len = max((length_range.max_len for length_range in length_ranges), default=0)
+        if max_len > LOOKUP_TABLE_MAX_LEN:
+            return None
+        lookup: List[Optional[LengthRange]] = [None] * (max_len + 1)
+        # Filled in reverse so that, as in a linear scan, the first matching range wins
+        for length_range in reversed(length_ranges):
+            span = length_range.max_len - length_range.min_len + 1
+            if span > 0:
+                lookup[length_range.min_len:length_range.max_len + 1] = [length_range] * span
+        return lookup
+
+    @staticmethod
+    def build_range_segments(length_ranges: List[LengthRange]) -> Tuple[List[int], List[Optional[LengthRange]]]:
+        # Sorted, non-overlapping segments for ranges too wide for a dense table.
+        # Each segment keeps the first range that covers it, so overlaps resolve as in a linear scan.
+        starts = sorted({bound for lr in length_ranges for bound in (lr.min_len, lr.max_len + 1)})
+        owners: List[Optional[LengthRange]] = []
+        for start in starts:
+            owners.append(next((lr for lr in length_ranges if lr.min_len <= start <= lr.max_len), None))
+        return starts, owners
+
+    @classmethod
+    def from_length_counter(cls, length_counter: Dict[int, int]) -> 'WordCounter':
+        # 'auto' mode: every length gets its own range, so counts are adopted as-is
+        max_len = max(length_counter.keys()) if length_counter else 0
+        if max_len > AUTO_DENSE_MAX_LEN:
+            length_ranges = [LengthRange(length, length) for length in sorted(length_counter.keys())]
+        else:
+            length_ranges = [LengthRange(i, i) for i in range(1, max_len + 1)]
 
-    def count_words(self, words: List[int]) -> None:
-        for word_len in words:
-            self.total_words += 1
-            matched = False
-            for length_range in self.length_ranges:
-                if length_range.contains(word_len):
-                    self.counts[length_range] += 1
-                    matched = True
-                    break
-            if not matched:
-                self.other_count += 1
+        counter = cls(length_ranges)
+        for length, count in length_counter.items():
+            counter.counts[LengthRange(length, length)] = count
+        counter.total_words = sum(length_counter.values())
+        return counter
+
+    def find_range(self, length: int) -> Optional[LengthRange]:
+        if self.range_lookup is None and self.segment_starts is None:
+            self.build_lookup()
+        if self.range_lookup is not None:
+            return self.range_lookup[length] if length < len(self.range_lookup) else None
+        idx = bisect.bisect_right(self.segment_starts, length) - 1
+        return self.segment_ranges[idx] if idx >= 0 else None
+
+    def count_words(self, length_counter: Dict[int, int]) -> None:
+        for length, count in length_counter.items():
+            length_range = self.find_range(length)
+            if length_range is None:
+                self.other_count += count
+            else:
+                self.counts[length_range] += count
+            self.total_words += count
 
 
 def get_terminal_size() -> Tuple[int, int]:
@@ -99,6 +177,37 @@ def get_color(index: int, total: int, use_color: bool) -> str:
     return COLORS[color_index]
 
 
+def resolve_colors(items: List[Tuple[str, int]], color_map: Dict[Tuple[str, int], int], color_enabled: bool) -> List[str]:
+    # Color code for every display item, resolved once instead of per rendered cell
+    if not color_enabled:
+        return [''] * len(items)
+    return [get_color(color_map.get(item, 0), len(items) - 1, True) if item[1] > 0 else '' for item in items]
+
+
+@dataclass
+class RenderContext:
+    items: List[Tuple[str, int]]
+    sorted_items: List[Tuple[str, int]]
+    color_map: Dict[Tuple[str, int], int]
+    max_count: int
+    colors: List[str]
+    show_other: bool
+
+    @classmethod
+    def from_counter(cls, counter: WordCounter, use_color: bool, show_other: bool) -> 'RenderContext':
+        # Shared by every display so items are sorted and colored only once per run
+        items = [(str(lr), counter.counts[lr]) for lr in counter.length_ranges]
+        if show_other:
+            items.append(('Other', counter.other_count))
+
+        sorted_items = sorted(items, key=lambda x: x[1], reverse=True)
+        color_map = {item: idx for idx, item in enumerate(sorted_items)}
+        max_count = max([count for _, count in items], default=1)
+        color_enabled = use_color and (sys.platform != 'win32' or HAS_COLORAMA)
+        colors = resolve_colors(items, color_map, color_enabled)
+        return cls(items, sorted_items, color_map, max_count, colors, show_other)
+
+
 def parse_length_ranges(range_str: str) -> List[LengthRange]:
     if range_str == 'auto':
         return []
@@ -114,218 +223,296 @@ def parse_length_ranges(range_str: str) -> List[LengthRange]:
     return ranges
 
 
-def count_words_from_list(words: List[str]) -> Counter:
-    lengths = [len(word) for word in words]
-    return Counter(lengths)
+@functools.lru_cache(maxsize=32)
+def delimiter_splitter(delimiter: str) -> Callable[[str], List[str]]:
+    # Split by the delimiter OR newline characters, so that \n always acts as an
+    # implicit delimiter and the whole file is never treated as one word
+    if len(delimiter) == 1:
+        # str.split is literal, so any single character (regex metacharacters included)
+        # can skip the regex engine once newlines are normalized to the delimiter
+        def split_on_char(content: str) -> List[str]:
+            return content.replace('\r', delimiter).replace('\n', delimiter).split(delimiter)
+        return split_on_char
+    return re.compile(f'[{re.escape(delimiter)}\\n\\r]+').split
 
 
-def process_file(filepath: str, num_threads: int, show_progress: bool, delimiter: Optional[str] = None) -> Counter:
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def count_words_from_list(words: List[str]) -> Counter:
+    return Counter(map(len, words))
 
-    if delimiter:
-        # If delimiter is a space, treat all whitespace (newlines, tabs, etc.) as delimiters
-        if delimiter == " ":
-            words = content.split()
-        else:
-            # Escape delimiter and split strictly, but also handle newlines as implicit delimiters
-            # to avoid treating the whole file as one word if \n is present
-            escaped_delim = re.escape(delimiter)
-            # Split by the delimiter OR newline characters
-            words = re.split(f'[{escaped_delim}\\n\\r]+', content)
-        
-        words = [word.strip() for word in words if word.strip()]
+
+def split_words(content: str, delimiter: str) -> List[str]:
+    # If delimiter is a space, treat all whitespace (newlines, tabs, etc.) as delimiters
+    if delimiter == " ":
+        words = content.split()
     else:
-        # Default behavior: standard word boundary detection
-        words = re.findall(r'\b\w+\b', content)
+        words = delimiter_splitter(delimiter)(content)
+    return [word.strip() for word in words if word.strip()]
+
+
+def count_file_region(filepath: str, start: int, end: int, delimiter: Optional[str]) -> Counter:
+    # Runs in a worker process: the file is mapped again here, so only offsets are
+    # sent to the worker and only a Counter is sent back
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            region = data[start:end]
+    if not delimiter:
+        return count_boundary_word_lengths(region)
+    return count_words_from_list(split_words(str(region, 'utf-8'), delimiter))
+
+
+def split_at_newlines(data: bytes, parts: int) -> List[Tuple[int, int]]:
+    # A newline always separates words (it is never \w and is an implicit --delim
+    # separator) and a 0x0A byte never occurs inside a UTF-8 sequence, so cutting
+    # just after one keeps each region self-contained
+    size = len(data)
+    bounds = [0]
+    for i in range(1, parts):
+        cut = data.find(b'\n', max(i * size // parts, bounds[-1]))
+        bounds.append(size if cut == -1 else cut + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def count_ascii_word_lengths(data: bytes, show_progress: bool = False) -> Counter:
+    # Histogram of \w+ run lengths computed on raw bytes; only valid for ASCII text.
+    # The buffer is scanned in fixed-size blocks so temporaries stay small, and a word
+    # still open at the end of a block is carried into the next one.
+    buf = np.frombuffer(data, dtype=np.uint8)
+    padding = np.zeros(1, dtype=bool)
+    counter = Counter()
+    carry = 0
+    for start in range(0, buf.size, ASCII_BLOCK_SIZE):
+        is_word = ASCII_WORD_BYTES[buf[start:start + ASCII_BLOCK_SIZE]]
+        padded = np.concatenate((padding, is_word, padding))
+        bounds = np.flatnonzero(padded[1:] != padded[:-1])
+        lengths = bounds[1::2] - bounds[0::2]
+
+        if carry:
+            if is_word[0]:
+                lengths[0] += carry
+            else:
+                counter[carry] += 1
+        if is_word[-1]:
+            carry = int(lengths[-1])
+            lengths = lengths[:-1]
+        else:
+            carry = 0
+
+        for length, count in enumerate(np.bincount(lengths).tolist()):
+            if count:
+                counter[length] += count
+        if show_progress and start + ASCII_BLOCK_SIZE < buf.size:
+            print_progress(start + ASCII_BLOCK_SIZE, buf.size)
+    if carry:
+        counter[carry] += 1
+    return counter
+
+
+def count_match_lengths(pattern: re.Pattern, text, show_progress: bool = False) -> Counter:
+    # Lengths are taken from match spans, so word strings are never built
+    matches = pattern.finditer(text)
+    if not show_progress:
+        return Counter(match.end() - match.start() for match in matches)
+    # Count in blocks of matches so progress can be reported without per-word overhead
+    counter = Counter()
+    while True:
+        spans = [match.span() for match in islice(matches, PROGRESS_BLOCK_SIZE)]
+        if not spans:
+            return counter
+        counter.update(end - start for start, end in spans)
+        if spans[-1][1] < len(text):
+            print_progress(spans[-1][1], len(text))
+
+
+def count_boundary_word_lengths(data: bytes, show_progress: bool = False) -> Counter:
+    # Byte lengths equal character lengths only for ASCII, so anything else is decoded
+    if NON_ASCII_BYTES_RE.search(data) is not None:
+        return count_match_lengths(WORD_RE, str(data, 'utf-8'), show_progress)
+    if HAS_NUMPY:
+        return count_ascii_word_lengths(data, show_progress)
+    return count_match_lengths(WORD_BYTES_RE, data, show_progress)
+
+
+def print_progress(processed: int, total: int) -> None:
+    progress = (processed / total) * 100
+    print(f'Progress: {progress:.1f}%', end='\r', flush=True, file=sys.stderr)
 
-    total_words = len(words)
+
+def process_file(filepath: str, num_threads: int, show_progress: bool, delimiter: Optional[str] = None) -> Counter:
+    # The file is mapped rather than read, so pure ASCII input is counted straight
+    # from the page cache without building a decoded copy of the whole file
+    with open(filepath, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files, pipes and devices cannot be mapped, so they are read instead
+            return process_data(f.read(), show_progress, delimiter)
+        try:
+            if num_threads > 1 and len(data) >= PARALLEL_MIN_BYTES:
+                return process_file_parallel(filepath, data, num_threads, show_progress, delimiter)
+            return process_data(data, show_progress, delimiter)
+        finally:
+            try:
+                data.close()
+            except BufferError:
+                # A traceback still holding a NumPy view keeps the mapping exported.
+                # It is unmapped once that view is released; the original error propagates.
+                pass
+
+
+def process_file_parallel(filepath: str, data: bytes, num_threads: int, show_progress: bool, delimiter: Optional[str]) -> Counter:
+    # Scanning and counting are CPU-bound and hold the GIL, so each worker process
+    # handles its own byte region of the file. Workers share no state: the main
+    # thread merges their Counters and tracks progress as regions complete.
+    total_bytes = len(data)
+    total_counter = Counter()
+    processed_bytes = 0
 
     if show_progress:
         print('Progress: 0.0%', end='\r', file=sys.stderr)
 
-    if total_words == 0:
-        return Counter()
-
-    if num_threads == 1:
-        counter = Counter()
-        for idx, word in enumerate(words):
-            counter.update([len(word)])
-            if show_progress and idx % 1000 == 0:
-                progress = (idx / total_words) * 100
-                print(f'Progress: {progress:.1f}%', end='\r', flush=True, file=sys.stderr)
-        if show_progress:
-            print('Progress: 100.0%', flush=True, file=sys.stderr)
-        return counter
-
-    chunk_size = total_words // num_threads
-    results = []
-    processed_words = [0]
-
-    def process_word_chunk(start_idx: int, end_idx: int) -> Counter:
-        word_chunk = words[start_idx:end_idx]
-        result = count_words_from_list(word_chunk)
+    with ProcessPoolExecutor(max_workers=num_threads) as executor:
+        region_sizes = {}
+        for start, end in split_at_newlines(data, num_threads):
+            future = executor.submit(count_file_region, filepath, start, end, delimiter)
+            region_sizes[future] = end - start
 
-        with progress_lock:
-            processed_words[0] += len(word_chunk)
-            if show_progress and processed_words[0] % 1000 == 0:
-                progress = (processed_words[0] / total_words) * 100
-                print(f'Progress: {progress:.1f}%', end='\r', flush=True, file=sys.stderr)
-
-        return result
-
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = []
-        for i in range(num_threads):
-            start_idx = i * chunk_size
-            end_idx = (i + 1) * chunk_size if i < num_threads - 1 else total_words
-            futures.append(executor.submit(process_word_chunk, start_idx, end_idx))
-
-        for future in futures:
-            results.append(future.result())
+        for future in as_completed(region_sizes):
+            total_counter.update(future.result())
+            processed_bytes += region_sizes[future]
+            if show_progress and processed_bytes < total_bytes:
+                print_progress(processed_bytes, total_bytes)
 
     if show_progress:
         print('Progress: 100.0%', flush=True, file=sys.stderr)
 
-    total_counter = Counter()
-    for counter in results:
-        total_counter.update(counter)
-
     return total_counter
 
 
-def display_table(counter: WordCounter, use_color: bool, show_other: bool) -> str:
-    output = []
-    output.append('\n' + '=' * 60)
-    output.append('Word Length Statistics')
-    output.append('=' * 60)
-    output.append(f"{'Length Range':<20} {'Count':<15} {'Percentage':<15}")
-    output.append('-' * 60)
+def process_data(data: bytes, show_progress: bool, delimiter: Optional[str] = None) -> Counter:
+    if not delimiter:
+        # Default behavior: standard word boundary detection
+        if show_progress:
+            print('Progress: 0.0%', end='\r', file=sys.stderr)
+        counter = count_boundary_word_lengths(data, show_progress)
+        if show_progress:
+            print('Progress: 100.0%', flush=True, file=sys.stderr)
+        return counter
+
+    words = split_words(str(data, 'utf-8'), delimiter)
+    total_words = len(words)
 
-    items = [(str(lr), counter.counts[lr]) for lr in counter.length_ranges]
-    if show_other:
-        items.append(('Other', counter.other_count))
+    if show_progress:
+        print('Progress: 0.0%', end='\r', file=sys.stderr)
 
-    sorted_items = sorted(items, key=lambda x: x[1], reverse=True)
-    color_map = {item: idx for idx, item in enumerate(sorted_items)}
+    if total_words == 0:
+        return Counter()
 
-    for idx, (range_str, count) in enumerate(items):
+    if not show_progress:
+        return count_words_from_list(words)
+
+    # Count in blocks so progress can be reported without per-word overhead
+    counter = Counter()
+    remaining_words = iter(words)
+    for processed_words in range(PROGRESS_BLOCK_SIZE, total_words, PROGRESS_BLOCK_SIZE):
+        counter.update(map(len, islice(remaining_words, PROGRESS_BLOCK_SIZE)))
+        print_progress(processed_words, total_words)
+    counter.update(map(len, remaining_words))
+    print('Progress: 100.0%', flush=True, file=sys.stderr)
+    return counter
+
+
+def display_table(counter: WordCounter, context: RenderContext) -> str:
+    output = io.StringIO()
+    write = output.write
+    write('\n' + '=' * 60 + '\n')
+    write('Word Length Statistics\n')
+    write('=' * 60 + '\n')
+    write(f"{'Length Range':<20} {'Count':<15} {'Percentage':<15}\n")
+    write('-' * 60 + '\n')
+
+    for (range_str, count), color in zip(context.items, context.colors):
         percentage = (count / counter.total_words * 100) if counter.total_words > 0 else 0
-        color = ''
-        if use_color and count > 0:
-            color_idx = color_map.get((range_str, count), 0)
-            color = get_color(color_idx, len(sorted_items) - 1, True)
-        should_use_color = use_color and color and (sys.platform != 'win32' or HAS_COLORAMA)
-        reset = RESET if should_use_color else ''
-        if not should_use_color:
-            color = ''
-        output.append(f'{color}{range_str:<20} {count:<15} {percentage:>6.2f}%{reset}')
+        reset = RESET if color else ''
+        write(f'{color}{range_str:<20} {count:<15} {percentage:>6.2f}%{reset}\n')
 
-    output.append('-' * 60)
-    output.append(f'{"Total":<20} {counter.total_words:<15} 100.00%')
-    output.append('=' * 60 + '\n')
+    write('-' * 60 + '\n')
+    write(f'{"Total":<20} {counter.total_words:<15} 100.00%\n')
+    write('=' * 60 + '\n')
 
-    return '\n'.join(output)
+    return output.getvalue()
 
 
-def display_horizontal_graph(counter: WordCounter, use_color: bool, show_other: bool) -> str:
+def display_horizontal_graph(counter: WordCounter, context: RenderContext) -> str:
     term_width, _ = get_terminal_size()
     max_bar_width = term_width - 45
 
-    output = []
-    output.append('\n' + '=' * term_width)
-    output.append('Horizontal Bar Graph')
-    output.append('=' * term_width)
-    output.append(f"{'Length Range':<15} {'Count':<10} {'Bar':<{max_bar_width}}")
-    output.append('-' * term_width)
-
-    items = [(str(lr), counter.counts[lr]) for lr in counter.length_ranges]
-    if show_other:
-        items.append(('Other', counter.other_count))
-
-    sorted_items = sorted(items, key=lambda x: x[1], reverse=True)
-    color_map = {item: idx for idx, item in enumerate(sorted_items)}
-    max_count = max(count for _, count in items) if items else 1
+    output = io.StringIO()
+    write = output.write
+    write('\n' + '=' * term_width + '\n')
+    write('Horizontal Bar Graph\n')
+    write('=' * term_width + '\n')
+    write(f"{'Length Range':<15} {'Count':<10} {'Bar':<{max_bar_width}}\n")
+    write('-' * term_width + '\n')
 
-    for idx, (range_str, count) in enumerate(items):
+    max_count = context.max_count
+    for (range_str, count), color in zip(context.items, context.colors):
         bar_length = int((count / max_count) * max_bar_width) if max_count > 0 else 0
         bar = '█' * bar_length
-        color = ''
-        if use_color and count > 0:
-            color_idx = color_map.get((range_str, count), 0)
-            color = get_color(color_idx, len(sorted_items) - 1, True)
-        should_use_color = use_color and color and (sys.platform != 'win32' or HAS_COLORAMA)
-        reset = RESET if should_use_color else ''
-        if not should_use_color:
-            color = ''
-        output.append(f'{color}{range_str:<15} {count:<10} {bar:<{max_bar_width}}{reset}')
+        reset = RESET if color else ''
+        write(f'{color}{range_str:<15} {count:<10} {bar:<{max_bar_width}}{reset}\n')
 
-    output.append('=' * term_width + '\n')
+    write('=' * term_width + '\n')
 
-    return '\n'.join(output)
+    return output.getvalue()
 
 
-def display_vertical_graph(counter: WordCounter, use_color: bool, show_other: bool) -> str:
+def display_vertical_graph(counter: WordCounter, context: RenderContext) -> str:
     _, term_height = get_terminal_size()
     max_chart_height = int((term_height - 10) * 0.6)
 
-    items = [(str(lr), counter.counts[lr]) for lr in counter.length_ranges]
-    if show_other:
-        items.append(('Other', counter.other_count))
-
-    sorted_items = sorted(items, key=lambda x: x[1], reverse=True)
-    color_map = {item: idx for idx, item in enumerate(sorted_items)}
-    max_count = max(count for _, count in items) if items else 1
+    items = context.items
+    max_count = context.max_count
     chart_height = min(max_chart_height, max_count)
 
-    output = []
-    output.append('\n' + '=' * 50)
-    output.append('Vertical Bar Graph')
-    output.append('=' * 50)
+    output = io.StringIO()
+    write = output.write
+    write('\n' + '=' * 50 + '\n')
+    write('Vertical Bar Graph\n')
+    write('=' * 50 + '\n')
 
-    bar_heights = []
-    for _, count in items:
-        height = int((count / max_count) * chart_height) if max_count > 0 else 0
-        bar_heights.append(max(1, height))
+    if max_count > 0:
+        bar_heights = [max(1, int((count / max_count) * chart_height)) for _, count in items]
+    else:
+        bar_heights = [1] * len(items)
+    bars = [f'{color}██{RESET}' if color else '██' for color in context.colors]
 
-    for level in range(max(bar_heights), 0, -1):
+    for level in range(max(bar_heights, default=0), 0, -1):
         row = []
-        for idx, bar_height in enumerate(bar_heights):
-            color = ''
-            if use_color and bar_height >= level:
-                count = items[idx][1]
-                if count > 0:
-                    color_idx = color_map.get(items[idx], 0)
-                    color = get_color(color_idx, len(sorted_items) - 1, True)
-            should_use_color = use_color and color and (sys.platform != 'win32' or HAS_COLORAMA)
-            reset = RESET if should_use_color else ''
-            if not should_use_color:
-                color = ''
+        for bar, bar_height in zip(bars, bar_heights):
             if bar_height >= level:
-                row.append(f'{color}██{reset}')
+                row.append(bar)
             else:
                 row.append('  ')
-        output.append('  ' + ' '.join(row))
+        write('  ' + ' '.join(row) + '\n')
 
-    output.append('  ' + '-'.join(['--' for _ in items]))
+    write('  ' + '-'.join(['--' for _ in items]) + '\n')
     labels = [range_str[:2].ljust(2) for range_str, _ in items]
-    output.append('  ' + ' '.join(labels))
-    output.append('=' * 50 + '\n')
+    write('  ' + ' '.join(labels) + '\n')
+    write('=' * 50 + '\n')
 
-    return '\n'.join(output)
+    return output.getvalue()
 
 
-def display_gui_graph(counter: WordCounter, show_other: bool) -> None:
+def display_gui_graph(counter: WordCounter, context: RenderContext) -> None:
     if not HAS_MATPLOTLIB:
         print("Error: matplotlib is not installed. Install it with: pip install matplotlib")
         return
 
     labels = [str(lr.min_len) if lr.min_len == lr.max_len else str(lr) for lr in counter.length_ranges]
-    counts = [counter.counts[lr] for lr in counter.length_ranges]
-
-    if show_other:
+    if context.show_other:
         labels.append('Other')
-        counts.append(counter.other_count)
+    counts = [count for _, count in context.items]
 
     colors = ['#ff0000', '#ffff00', '#00ff00', '#00ffff', '#ff00ff', '#ffffff']
 
@@ -348,6 +535,32 @@ def display_gui_graph(counter: WordCounter, show_other: bool) -> None:
     plt.show()
 
 
+def write_output(output: str, output_file: Optional[str]) -> None:
+    # Encode once; where newlines need no translation the same bytes go to stdout and the file
+    blob = output.encode('utf-8')
+
+    # The bytes bypass any wrapper around sys.stdout. colorama installs one that
+    # strips or translates ANSI codes when stdout is not a terminal (or on Windows),
+    # so wrapped streams and non-UTF-8 consoles still go through text-mode print
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    stdout_encoding = (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '')
+    if (sys.stdout is sys.__stdout__ and stdout_buffer is not None
+            and sys.platform != 'win32' and stdout_encoding == 'utf8'):
+        sys.stdout.flush()
+        stdout_buffer.write(blob)
+        stdout_buffer.write(b'\n')
+        stdout_buffer.flush()
+    else:
+        print(output)
+
+    if output_file:
+        # Use the platform's line endings, as a text-mode write would (CRLF on Windows)
+        if os.linesep != '\n':
+            blob = output.replace('\n', os.linesep).encode('utf-8')
+        with open(output_file, 'wb') as f:
+            f.write(blob)
+
+
 def print_short_help() -> None:
     print(f"Word Length Statistics Analyzer - Author: {__CODE_AUTHOR__} - Version: {__CODE_VERSION__} - Date: {__CODE_DATE__}", file=sys.stderr)
     print(file=sys.stderr)
@@ -391,7 +604,7 @@ DISPLAY OPTIONS:
     --other         Display statistics for words not matching any specified length range
  
 PERFORMANCE OPTIONS:
-    -t N            Number of threads for parallel processing (default: 1)
+    -t N            Number of worker processes for parallel processing (default: 1)
     --pb            Show progress percentage during file processing
  
 HELP OPTIONS:
@@ -434,7 +647,7 @@ def main():
     parser.add_argument('--other', dest='show_other', action='store_true',
                         help='Display statistics for words not matching any specified length range')
     parser.add_argument('-t', dest='num_threads', type=int, default=1,
-                        help='Number of threads for parallel processing (default: 1)')
+                        help='Number of worker processes for parallel processing (default: 1)')
     parser.add_argument('--pb', dest='show_progress', action='store_true',
                         help='Show progress percentage during file processing')
 
@@ -451,44 +664,29 @@ def main():
     length_ranges = parse_length_ranges(args.length_ranges)
     length_counter = Counter(process_file(args.input_file, args.num_threads, args.show_progress, args.delimiter))
 
-    if not length_ranges:
-        max_len = max(length_counter.keys()) if length_counter else 0
-        if max_len > 1000:
-            length_ranges = [LengthRange(length, length) for length in sorted(length_counter.keys())]
-        else:
-            length_ranges = [LengthRange(i, i) for i in range(1, max_len + 1)]
+    if length_ranges:
+        counter = WordCounter(length_ranges)
+        counter.count_words(length_counter)
+    else:
+        counter = WordCounter.from_length_counter(length_counter)
 
-    counter = WordCounter(length_ranges)
-    for length, count in length_counter.items():
-        matched = False
-        for length_range in length_ranges:
-            if length_range.contains(length):
-                counter.counts[length_range] += count
-                matched = True
-                break
-        if not matched:
-            counter.other_count += count
-        counter.total_words += count
+    context = RenderContext.from_counter(counter, args.use_color, args.show_other)
 
     output_lines = []
 
-    output_lines.append(display_table(counter, args.use_color, args.show_other))
+    output_lines.append(display_table(counter, context))
 
     if args.graph_mode == 'h':
-        output_lines.append(display_horizontal_graph(counter, args.use_color, args.show_other))
+        output_lines.append(display_horizontal_graph(counter, context))
     elif args.graph_mode == 'v':
-        output_lines.append(display_vertical_graph(counter, args.use_color, args.show_other))
+        output_lines.append(display_vertical_graph(counter, context))
 
     output = '\n'.join(output_lines)
 
-    print(output)
-
-    if args.output_file:
-        with open(args.output_file, 'w', encoding='utf-8') as f:
-            f.write(output)
+    write_output(output, args.output_file)
 
     if args.gui:
-        display_gui_graph(counter, args.show_other)
+        display_gui_graph(counter, context)
 
 
 if __name__ == '__main__':